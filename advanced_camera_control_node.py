@@ -5,12 +5,126 @@ Reads camera information from Load 3D nodes and generates precise camera control
 Author: Jianghong Zhu
 """
 
+import bisect
+import functools
+import json
 import math
+import sys
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+_atan = math.atan
+_atan2 = math.atan2
+_hypot = math.hypot
+_json_dumps = json.dumps
+
+_RAD2DEG = 180.0 / math.pi
+_DEG2RAD = math.pi / 180.0
+
+# Indexed by sign(value) + 1, i.e. (value > 0) - (value < 0) + 1.
+_TILT_VERBS = ("tilt up", "tilt", "tilt down")
+_PAN_VERBS = ("pan to left", "pan", "pan to right")
+
+# The camera JSON has a fixed shape, so hand-format it instead of paying for
+# json.dumps's type dispatch. The tilt/pan strings are built from the verb
+# tables above and contain nothing that needs escaping; shot_type is encoded
+# with json.dumps, which also yields "null" for None.
+_CAMERA_JSON_TMPL = (
+    '{{"camera":{{"focal_length_mm":{focal},"sensor_width_mm":{sensor_w},'
+    '"sensor_height_mm":{sensor_h},"distance_m":{distance},"tilt_deg":"{tilt}",'
+    '"pan_deg":"{pan}","roll_deg":{roll},"shot_type":{shot}}}}}'
+)
+
+
+def _phrase_right(angle_int):
+    return f"Pan the camera {angle_int} degrees to the right"
+
+
+def _phrase_left(angle_int):
+    left_angle = 360 - angle_int if angle_int >= 270 else angle_int
+    return f"Pan the camera {left_angle} degrees to the left"
+
+
+def _phrase_behind(angle_int):
+    return "looking from behind"
+
+
+def _phrase_back(angle_int):
+    if 90 <= angle_int <= 180:
+        return f"Pan the camera {angle_int} degrees to the right-back side"
+    if 180 < angle_int <= 270:
+        return f"Pan the camera {angle_int} degrees to the left-back side"
+    return f"looking from behind at {angle_int} degree"
+
+
+# Phrase builder for _get_camera_position_prompt, keyed by the quantized
+# signs of the camera's x/z offsets from the target.
+_QUADRANT_PHRASE = {
+    (-1, -1): _phrase_back,
+    (-1, 0): _phrase_left,
+    (-1, 1): _phrase_left,
+    (0, -1): _phrase_behind,
+    (0, 0): _phrase_behind,
+    (0, 1): lambda angle_int: "",
+    (1, -1): _phrase_back,
+    (1, 0): _phrase_right,
+    (1, 1): _phrase_right,
+}
+
+
+def _geometry_kernel(px, py, pz, tx, ty, tz):
+    """Fused scalar kernel: distance, pitch and yaw (degrees) from raw coordinates"""
+    dx = px - tx
+    dy = py - ty
+    dz = pz - tz
+
+    distance = math.sqrt(dx * dx + dy * dy + dz * dz)
+    horizontal_dist = math.sqrt(dx * dx + dz * dz)
+
+    if horizontal_dist > 0.001:
+        pitch = _RAD2DEG * math.atan2(dy, horizontal_dist)
+    else:
+        pitch = 90.0 if dy > 0 else -90.0
+
+    if abs(dz) > 0.001:
+        yaw = _RAD2DEG * math.atan2(dx, -dz)
+    else:
+        yaw = 0.0
+
+    return (distance, pitch, yaw)
+
+
+if numba is not None:
+    _geometry_kernel = numba.njit(cache=True, fastmath=True)(_geometry_kernel)
+
+
+@functools.lru_cache(maxsize=64)
+def _fov_from_focal(focal_length_mm, sensor_dim_mm):
+    """FOV in degrees for a focal length / sensor dimension pair."""
+    return 2.0 * _atan(sensor_dim_mm / (2.0 * focal_length_mm)) * _RAD2DEG
+
+
+@functools.lru_cache(maxsize=64)
+def _focal_from_fov(fov):
+    """Estimated focal length in mm for a FOV in degrees, clamped to 14-200."""
+    fov_rad = fov * _DEG2RAD
+    focal_length = 18.0 / math.tan(fov_rad / 2.0)
+    return max(14.0, min(200.0, focal_length))
 
 
 class AdvancedCameraControlNode:
     """Advanced camera control prompt generator for ComfyUI."""
-    
+
+    __slots__ = ()
+
     EYE_LEVEL_HEIGHT = 0.425
     DEFAULT_POSITION = {"x": 0.0, "y": EYE_LEVEL_HEIGHT, "z": 0.5}
     DEFAULT_TARGET = {"x": 0.0, "y": EYE_LEVEL_HEIGHT, "z": 0.0}
@@ -30,29 +144,40 @@ class AdvancedCameraControlNode:
         "extreme wide shot": (0, 5),
     }
     
-    CAMERA_SHOTS = [
-        {"name": "Extreme Close-Up", "distance_m": [0.3, 0.6], "focal_length_mm": [85, 135], "fov_deg": [10, 20]},
-        {"name": "Close-Up", "distance_m": [0.6, 1.2], "focal_length_mm": [50, 85], "fov_deg": [20, 30]},
-        {"name": "Medium Close-Up", "distance_m": [1.0, 1.8], "focal_length_mm": [35, 50], "fov_deg": [30, 40]},
-        {"name": "Medium Shot", "distance_m": [1.5, 3.0], "focal_length_mm": [28, 50], "fov_deg": [35, 45]},
-        {"name": "Medium Long Shot", "distance_m": [2.5, 4.0], "focal_length_mm": [24, 35], "fov_deg": [45, 55]},
-        {"name": "Full Shot", "distance_m": [3.0, 5.0], "focal_length_mm": [24, 35], "fov_deg": [50, 60]},
-        {"name": "Wide Shot", "distance_m": [5.0, 10.0], "focal_length_mm": [18, 24], "fov_deg": [60, 90]},
-        {"name": "Extreme Wide Shot", "distance_m": [10, 50], "focal_length_mm": [14, 20], "fov_deg": [90, 120]},
-    ]
-    
-    CAMERA_ANGLES = [
-        {"name": "Eye Level", "tilt_deg": [-5, 5]},
-        {"name": "High Angle", "tilt_deg": [-20, -45]},
-        {"name": "Slight Low Angle", "tilt_deg": [5, 15]},
-        {"name": "Standard Low Angle", "tilt_deg": [15, 30]},
-        {"name": "Deep Low Angle", "tilt_deg": [30, 45]},
-        {"name": "Extreme Low Angle", "tilt_deg": [45, 90]},
-        {"name": "Bird's Eye", "tilt_deg": [-80, -90]},
-        {"name": "Dutch Angle", "roll_deg": [5, 30]},
-        {"name": "Dutch Low Angle", "roll_deg": [10, 45]},
-    ]
+    CAMERA_SHOTS = (
+        {"name": "Extreme Close-Up", "distance_m": (0.3, 0.6), "focal_length_mm": (85, 135), "fov_deg": (10, 20)},
+        {"name": "Close-Up", "distance_m": (0.6, 1.2), "focal_length_mm": (50, 85), "fov_deg": (20, 30)},
+        {"name": "Medium Close-Up", "distance_m": (1.0, 1.8), "focal_length_mm": (35, 50), "fov_deg": (30, 40)},
+        {"name": "Medium Shot", "distance_m": (1.5, 3.0), "focal_length_mm": (28, 50), "fov_deg": (35, 45)},
+        {"name": "Medium Long Shot", "distance_m": (2.5, 4.0), "focal_length_mm": (24, 35), "fov_deg": (45, 55)},
+        {"name": "Full Shot", "distance_m": (3.0, 5.0), "focal_length_mm": (24, 35), "fov_deg": (50, 60)},
+        {"name": "Wide Shot", "distance_m": (5.0, 10.0), "focal_length_mm": (18, 24), "fov_deg": (60, 90)},
+        {"name": "Extreme Wide Shot", "distance_m": (10, 50), "focal_length_mm": (14, 20), "fov_deg": (90, 120)},
+    )
     
+    _SHOT_NAME_TO_LOWER = {shot["name"]: shot["name"].lower() for shot in CAMERA_SHOTS}
+
+    CAMERA_ANGLES = (
+        {"name": "Eye Level", "tilt_deg": (-5, 5)},
+        {"name": "High Angle", "tilt_deg": (-20, -45)},
+        {"name": "Slight Low Angle", "tilt_deg": (5, 15)},
+        {"name": "Standard Low Angle", "tilt_deg": (15, 30)},
+        {"name": "Deep Low Angle", "tilt_deg": (30, 45)},
+        {"name": "Extreme Low Angle", "tilt_deg": (45, 90)},
+        {"name": "Bird's Eye", "tilt_deg": (-80, -90)},
+        {"name": "Dutch Angle", "roll_deg": (5, 30)},
+        {"name": "Dutch Low Angle", "roll_deg": (10, 45)},
+    )
+
+    _ANGLE_NAME_TO_LOWER = {
+        "High Angle": "high angle",
+        "Slight Low Angle": "slight low angle",
+        "Standard Low Angle": "standard low angle",
+        "Deep Low Angle": "deep low angle",
+        "Extreme Low Angle": "extreme low angle",
+        "Bird's Eye": "bird's eye view",
+    }
+
     EYE_LEVEL_TOLERANCE = 5.0
     DUTCH_ANGLE_ROLL_MIN = 5.0
     HIGH_ANGLE_MIN = 15.0
@@ -60,6 +185,8 @@ class AdvancedCameraControlNode:
     LOW_ANGLE_MAX = -15.0
     WORM_EYE_MAX = -75.0
     
+    PROMPT_CACHE_MAX_CUSTOM_LEN = 512
+
     EXTREME_CLOSE_UP_MAX = 0.6
     CLOSE_UP_MAX = 1.2
     MEDIUM_SHOT_MAX = 3.0
@@ -108,19 +235,106 @@ class AdvancedCameraControlNode:
         position = camera_info.get("position", {})
         target = camera_info.get("target", {})
         zoom = camera_info.get("zoom", 1)
-        
-        distance = self._calculate_distance(position, target)
+
+        if np is not None and isinstance(position, (list, tuple, np.ndarray)):
+            return self._generate_prompt_batch(
+                position, target, zoom, focal_length_mm, object_scale_meters, custom_description
+            )
+
+        if not custom_description or len(custom_description) <= self.PROMPT_CACHE_MAX_CUSTOM_LEN:
+            try:
+                return _generate_prompt_cached(
+                    _coords_key(position), _coords_key(target), zoom,
+                    focal_length_mm, object_scale_meters, custom_description
+                )
+            except TypeError:
+                pass
+
+        distance, pitch, yaw, roll = self._camera_geometry(position, target)
+
+        return self._format_prompt(
+            position, target, zoom, distance, pitch, yaw, roll,
+            focal_length_mm, object_scale_meters, custom_description
+        )
+
+    def _generate_prompt_batch(self, position, target, zoom, focal_length_mm,
+                               object_scale_meters, custom_description):
+        """Generate one prompt per frame for a batch of camera positions/targets"""
+        pos = self._coords_array(position)
+        tgt = self._coords_array(target)
+        if pos.shape[0] == 0:
+            return ("", "[]")
+
+        pos, tgt = np.broadcast_arrays(pos, tgt)
+        distances = np.linalg.norm(pos - tgt, axis=1)
+        pitches, yaws = self._calculate_camera_angles_batch(pos, tgt)
+
+        prompts = []
+        jsons = []
+        for pos_row, tgt_row, distance, pitch, yaw in zip(
+            pos.tolist(), tgt.tolist(), distances.tolist(), pitches.tolist(), yaws.tolist()
+        ):
+            pos_dict = {"x": pos_row[0], "y": pos_row[1], "z": pos_row[2]}
+            tgt_dict = {"x": tgt_row[0], "y": tgt_row[1], "z": tgt_row[2]}
+            prompt, camera_json = self._format_prompt(
+                pos_dict, tgt_dict, zoom, distance, pitch, yaw, 0.0,
+                focal_length_mm, object_scale_meters, custom_description
+            )
+            prompts.append(prompt)
+            jsons.append(camera_json)
+
+        return ("\n".join(prompts), "[" + ",".join(jsons) + "]")
+
+    @staticmethod
+    def _coords_array(value):
+        """Coerce a batch of coordinates (ndarray, or list of xyz dicts/triples) to an (N, 3) float array"""
+        if isinstance(value, np.ndarray):
+            return np.atleast_2d(value.astype(np.float64, copy=False))
+        if isinstance(value, dict):
+            return np.asarray([[value.get("x", 0), value.get("y", 0), value.get("z", 0)]], dtype=np.float64)
+        rows = [
+            (v.get("x", 0), v.get("y", 0), v.get("z", 0)) if isinstance(v, dict) else tuple(v)
+            for v in value
+        ]
+        return np.asarray(rows, dtype=np.float64)
+
+    @staticmethod
+    def _calculate_camera_angles_batch(pos, tgt):
+        """Vectorized pitch/yaw in degrees for (N, 3) position/target arrays"""
+        delta = pos - tgt
+        dx, dy, dz = delta[:, 0], delta[:, 1], delta[:, 2]
+
+        horizontal_dist = np.hypot(dx, dz)
+        pitches = np.where(
+            horizontal_dist > 0.001,
+            np.degrees(np.arctan2(dy, horizontal_dist)),
+            np.where(dy > 0, 90.0, -90.0),
+        )
+        yaws = np.where(np.abs(dz) > 0.001, np.degrees(np.arctan2(dx, -dz)), 0.0)
+
+        return (pitches, yaws)
+
+    def _format_prompt(self, position, target, zoom, distance, pitch, yaw, roll,
+                       focal_length_mm, object_scale_meters, custom_description):
+        """Assemble the prompt and camera JSON from precomputed geometry"""
         distance_meters = distance * self.GRID_TO_METERS
-        pitch, yaw, roll = self._calculate_camera_angles(position, target)
-        
+
         fov = self._calculate_fov_from_focal_length(focal_length_mm, use_horizontal=True)
-        
+
+        abs_pitch = abs(pitch)
+        pitch_significant = abs_pitch > self.EYE_LEVEL_TOLERANCE
+
         angle_type = None
-        if abs(pitch) > self.EYE_LEVEL_TOLERANCE:
+        if pitch_significant:
             angle_type = self._get_angle_type_name(pitch, roll)
         
-        shot_prompt = self._get_shot_type_prompt(distance, zoom, fov, focal_length_mm, object_scale_meters)
-        position_prompt = self._get_camera_position_prompt(position, target, pitch, yaw)
+        shot_type_name, camera_info_str = self._get_shot_type_prompt(
+            distance, zoom, fov, focal_length_mm, object_scale_meters
+        )
+        position_prompt = ""
+        if position and target:
+            dx, dy, dz = self._get_deltas(position, target)
+            position_prompt = self._get_camera_position_prompt(dx, dy, dz, pitch, yaw)
         
         prompt_parts = []
         description_parts = []
@@ -128,19 +342,13 @@ class AdvancedCameraControlNode:
         camera_position_text = position_prompt if position_prompt else None
         
         vertical_angle_text = None
-        if abs(pitch) > self.EYE_LEVEL_TOLERANCE and angle_type:
-            pitch_deg = int(abs(pitch))
-            vertical_angle_text = f"tilt down at {pitch_deg} degree" if pitch > 0 else f"tilt up at {pitch_deg} degree"
-        
-        shot_type_name = None
-        camera_info_text = None
-        if shot_prompt:
-            if "(" in shot_prompt:
-                shot_type_name = shot_prompt.split("(")[0].strip()
-                camera_info_text = "(" + shot_prompt.split("(")[1].strip()
-            else:
-                shot_type_name = shot_prompt.strip()
+        if pitch_significant and angle_type:
+            pitch_deg = int(abs_pitch)
+            tilt_verb = _TILT_VERBS[(pitch > 0) - (pitch < 0) + 1]
+            vertical_angle_text = f"{tilt_verb} at {pitch_deg} degree"
         
+        camera_info_text = f"({camera_info_str})" if camera_info_str else None
+
         movement_parts = []
         if camera_position_text:
             movement_parts.append(camera_position_text)
@@ -185,118 +393,70 @@ class AdvancedCameraControlNode:
     def _generate_camera_json(self, position, target, pitch, yaw, roll, distance_meters, 
                               focal_length_mm, fov, shot_type_name):
         """Generate JSON format for camera information"""
-        import json
-        
         shot_type_json = None
         if shot_type_name:
-            shot_type_json = shot_type_name.replace(" ", "_").replace("-", "_").lower()
-        
-        tilt_deg_value = round(pitch, 1)
-        if pitch > 0:
-            tilt_deg_str = f"tilt down {abs(tilt_deg_value)}"
-        elif pitch < 0:
-            tilt_deg_str = f"tilt up {abs(tilt_deg_value)}"
-        else:
-            tilt_deg_str = f"tilt {tilt_deg_value}"
-        
-        pan_deg_value = round(yaw, 1)
-        if yaw > 0:
-            pan_deg_str = f"pan to right {abs(pan_deg_value)}"
-        elif yaw < 0:
-            pan_deg_str = f"pan to left {abs(pan_deg_value)}"
-        else:
-            pan_deg_str = f"pan {pan_deg_value}"
-        
-        camera_data = {
-            "focal_length_mm": int(focal_length_mm) if focal_length_mm else None,
-            "sensor_width_mm": int(self.SENSOR_WIDTH_MM),
-            "sensor_height_mm": int(self.SENSOR_HEIGHT_MM),
-            "distance_m": round(distance_meters, 2),
-            "tilt_deg": tilt_deg_str,
-            "pan_deg": pan_deg_str,
-            "roll_deg": round(roll, 1),
-            "shot_type": shot_type_json
-        }
+            shot_type_json = _SHOT_TYPE_TO_JSON.get(shot_type_name)
+            if shot_type_json is None:
+                shot_type_json = shot_type_name.replace(" ", "_").replace("-", "_").lower()
         
-        return json.dumps({"camera": camera_data}, indent=4)
+        tilt_verb = _TILT_VERBS[(pitch > 0) - (pitch < 0) + 1]
+        tilt_deg_str = f"{tilt_verb} {abs(round(pitch, 1))}"
+
+        pan_verb = _PAN_VERBS[(yaw > 0) - (yaw < 0) + 1]
+        pan_deg_str = f"{pan_verb} {abs(round(yaw, 1))}"
+        
+        return _CAMERA_JSON_TMPL.format(
+            focal=int(focal_length_mm) if focal_length_mm else "null",
+            sensor_w=int(self.SENSOR_WIDTH_MM),
+            sensor_h=int(self.SENSOR_HEIGHT_MM),
+            distance=round(distance_meters, 2),
+            tilt=tilt_deg_str,
+            pan=pan_deg_str,
+            roll=round(roll, 1),
+            shot=_json_dumps(shot_type_json),
+        )
     
+    @staticmethod
+    def _get_deltas(position, target):
+        """Camera-to-target coordinate deltas (dx, dy, dz)"""
+        return (
+            position.get("x", 0) - target.get("x", 0),
+            position.get("y", 0) - target.get("y", 0),
+            position.get("z", 0) - target.get("z", 0),
+        )
+
+    def _camera_geometry(self, position, target):
+        """Calculate distance and pitch/yaw/roll angles in a single traversal"""
+        if not position or not target:
+            return (0, 0, 0, 0)
+
+        distance, pitch, yaw = _geometry_kernel(
+            position.get("x", 0), position.get("y", 0), position.get("z", 0),
+            target.get("x", 0), target.get("y", 0), target.get("z", 0),
+        )
+        return (distance, pitch, yaw, 0.0)
+
     def _calculate_distance(self, position, target):
         """Calculate 3D distance from camera position to target"""
-        if not position or not target:
-            return 0
-        
-        dx = position.get("x", 0) - target.get("x", 0)
-        dy = position.get("y", 0) - target.get("y", 0)
-        dz = position.get("z", 0) - target.get("z", 0)
-        
-        return math.sqrt(dx * dx + dy * dy + dz * dz)
-    
+        return self._camera_geometry(position, target)[0]
+
     def _calculate_camera_angles(self, position, target):
         """Calculate camera angles: pitch (vertical), yaw (horizontal), roll (rotation)"""
-        if not position or not target:
-            return (0, 0, 0)
-        
-        pos_x = position.get("x", 0)
-        pos_y = position.get("y", 0)
-        pos_z = position.get("z", 0)
-        
-        tgt_x = target.get("x", 0)
-        tgt_y = target.get("y", 0)
-        tgt_z = target.get("z", 0)
-        
-        dx = pos_x - tgt_x
-        dy = pos_y - tgt_y
-        dz = pos_z - tgt_z
-        
-        horizontal_dist = math.sqrt(dx * dx + dz * dz)
-        
-        if horizontal_dist > 0.001:
-            pitch_rad = math.atan2(dy, horizontal_dist)
-            pitch = math.degrees(pitch_rad)
-        else:
-            pitch = 90.0 if dy > 0 else -90.0
-        
-        if abs(dz) > 0.001:
-            yaw_rad = math.atan2(dx, -dz)
-            yaw = math.degrees(yaw_rad)
-        else:
-            yaw = 0.0
-        
-        roll = 0.0
-        
-        return (pitch, yaw, roll)
+        return self._camera_geometry(position, target)[1:]
     
     def _get_angle_type_name(self, pitch, roll):
         """Get angle type name"""
-        if abs(roll) >= 10 and pitch < 0:
-            for angle in self.CAMERA_ANGLES:
-                if angle["name"] == "Dutch Low Angle" and "roll_deg" in angle:
-                    roll_range = angle["roll_deg"]
-                    if roll_range[0] <= abs(roll) <= roll_range[1]:
-                        return "dutch low angle"
-        
-        if abs(roll) >= self.DUTCH_ANGLE_ROLL_MIN:
+        abs_roll = abs(roll)
+        if pitch < 0 and _DUTCH_LOW_MIN <= abs_roll <= _DUTCH_LOW_MAX:
+            return "dutch low angle"
+
+        if abs_roll >= self.DUTCH_ANGLE_ROLL_MIN:
             return "dutch angle"
-        
-        for angle in self.CAMERA_ANGLES:
-            if "tilt_deg" in angle:
-                tilt_range = angle["tilt_deg"]
-                tilt_value = -pitch
-                
-                if tilt_range[0] <= tilt_value <= tilt_range[1]:
-                    angle_name = angle["name"]
-                    if angle_name == "High Angle":
-                        return "high angle"
-                    elif angle_name == "Slight Low Angle":
-                        return "slight low angle"
-                    elif angle_name == "Standard Low Angle":
-                        return "standard low angle"
-                    elif angle_name == "Deep Low Angle":
-                        return "deep low angle"
-                    elif angle_name == "Extreme Low Angle":
-                        return "extreme low angle"
-                    elif angle_name == "Bird's Eye":
-                        return "bird's eye view"
+
+        tilt_value = -pitch
+        idx = bisect.bisect_left(_TILT_MAXS, tilt_value)
+        if idx < len(_TILT_MAXS) and _TILT_BUCKETS[idx][0] <= tilt_value:
+            return _TILT_BUCKETS[idx][2]
         
         if pitch >= self.BIRD_EYE_MIN:
             return "bird's eye view"
@@ -338,15 +498,12 @@ class AdvancedCameraControlNode:
             return None
         
         sensor_dim = self.SENSOR_WIDTH_MM if use_horizontal else self.SENSOR_HEIGHT_MM
-        fov_rad = 2.0 * math.atan(sensor_dim / (2.0 * focal_length_mm))
-        return math.degrees(fov_rad)
-    
+        return _fov_from_focal(focal_length_mm, sensor_dim)
+
     def _estimate_focal_length(self, fov):
         """Estimate focal length from FOV"""
         if fov and fov > 0:
-            fov_rad = math.radians(fov)
-            focal_length = 18.0 / math.tan(fov_rad / 2.0)
-            return max(14.0, min(200.0, focal_length))
+            return _focal_from_fov(fov)
         return None
     
     def _calculate_framing_shot_type(self, object_scale_meters, distance_meters, focal_length_mm, use_horizontal=False):
@@ -360,10 +517,12 @@ class AdvancedCameraControlNode:
         sensor_dim_mm = self.SENSOR_WIDTH_MM if use_horizontal else self.SENSOR_HEIGHT_MM
         percent_of_frame = 100.0 * projected_mm / sensor_dim_mm
         
-        for shot_name, (min_pct, max_pct) in self.FRAMING_THRESHOLDS.items():
-            if min_pct <= percent_of_frame < max_pct or (max_pct >= 1000 and percent_of_frame >= min_pct):
+        idx = bisect.bisect_right(_FRAMING_MINS, percent_of_frame) - 1
+        if idx >= 0:
+            min_pct, max_pct, shot_name = _FRAMING[idx]
+            if percent_of_frame < max_pct or (max_pct >= 1000 and percent_of_frame >= min_pct):
                 return shot_name
-        
+
         if percent_of_frame >= 100:
             return "extreme close-up"
         elif percent_of_frame < 0.1:
@@ -372,7 +531,7 @@ class AdvancedCameraControlNode:
         return None
     
     def _get_shot_type_prompt(self, distance, zoom, fov=None, focal_length_mm=None, object_scale_meters=None):
-        """Generate shot type prompt"""
+        """Determine the shot type name and the camera info text that accompanies it"""
         distance_meters = distance * self.GRID_TO_METERS
         distance_str = f"{distance_meters:.1f} m"
         
@@ -390,77 +549,23 @@ class AdvancedCameraControlNode:
             )
         
         if shot_type is None:
-            for shot in self.CAMERA_SHOTS:
-                dist_range = shot["distance_m"]
-                if dist_range[0] <= distance_meters <= dist_range[1]:
-                    shot_name = shot["name"]
-                    if shot_name == "Extreme Close-Up":
-                        shot_type = "extreme close-up"
-                    elif shot_name == "Close-Up":
-                        shot_type = "close-up"
-                    elif shot_name == "Medium Close-Up":
-                        shot_type = "medium close-up"
-                    elif shot_name == "Medium Shot":
-                        shot_type = "medium shot"
-                    elif shot_name == "Medium Long Shot":
-                        shot_type = "medium long shot"
-                    elif shot_name == "Full Shot":
-                        shot_type = "full shot"
-                    elif shot_name == "Wide Shot":
-                        shot_type = "wide shot"
-                    elif shot_name == "Extreme Wide Shot":
-                        shot_type = "extreme wide shot"
-                    break
-        
+            idx = bisect.bisect_left(_SHOT_DIST_MAX, distance_meters)
+            if idx < len(_SHOT_DIST_MAX) and _SHOT_DIST_MIN[idx] <= distance_meters:
+                shot_type = _SHOT_NAMES[idx]
+
         if shot_type is None and fov is not None:
             try:
                 fov_deg = float(fov)
-                for shot in self.CAMERA_SHOTS:
-                    fov_range = shot["fov_deg"]
-                    if fov_range[0] <= fov_deg <= fov_range[1]:
-                        shot_name = shot["name"]
-                        if shot_name == "Extreme Close-Up":
-                            shot_type = "extreme close-up"
-                        elif shot_name == "Close-Up":
-                            shot_type = "close-up"
-                        elif shot_name == "Medium Close-Up":
-                            shot_type = "medium close-up"
-                        elif shot_name == "Medium Shot":
-                            shot_type = "medium shot"
-                        elif shot_name == "Medium Long Shot":
-                            shot_type = "medium long shot"
-                        elif shot_name == "Full Shot":
-                            shot_type = "full shot"
-                        elif shot_name == "Wide Shot":
-                            shot_type = "wide shot"
-                        elif shot_name == "Extreme Wide Shot":
-                            shot_type = "extreme wide shot"
-                        break
+                idx = bisect.bisect_left(_SHOT_FOV_MAX, fov_deg)
+                if idx < len(_SHOT_FOV_MAX) and _SHOT_FOV_MIN[idx] <= fov_deg:
+                    shot_type = _SHOT_NAMES[idx]
             except (ValueError, TypeError):
                 pass
-        
+
         if shot_type is None and estimated_focal is not None:
-            for shot in self.CAMERA_SHOTS:
-                focal_range = shot["focal_length_mm"]
-                if focal_range[0] <= estimated_focal <= focal_range[1]:
-                    shot_name = shot["name"]
-                    if shot_name == "Extreme Close-Up":
-                        shot_type = "extreme close-up"
-                    elif shot_name == "Close-Up":
-                        shot_type = "close-up"
-                    elif shot_name == "Medium Close-Up":
-                        shot_type = "medium close-up"
-                    elif shot_name == "Medium Shot":
-                        shot_type = "medium shot"
-                    elif shot_name == "Medium Long Shot":
-                        shot_type = "medium long shot"
-                    elif shot_name == "Full Shot":
-                        shot_type = "full shot"
-                    elif shot_name == "Wide Shot":
-                        shot_type = "wide shot"
-                    elif shot_name == "Extreme Wide Shot":
-                        shot_type = "extreme wide shot"
-                    break
+            idx = bisect.bisect_right(_SHOT_FOCAL_MIN, estimated_focal) - 1
+            if idx >= 0 and estimated_focal <= _SHOT_FOCAL_MAX[idx]:
+                shot_type = _SHOT_FOCAL_NAMES[idx]
         
         if shot_type is None:
             if distance_meters < self.EXTREME_CLOSE_UP_MAX:
@@ -487,72 +592,138 @@ class AdvancedCameraControlNode:
             if fov_deg:
                 camera_info_parts.append(f"FOV {fov_deg}°")
         
-        camera_info = " ".join(camera_info_parts)
-        return f"{shot_type} ({camera_info})"
+        return (shot_type, " ".join(camera_info_parts))
     
-    def _get_camera_position_prompt(self, position, target, pitch, yaw):
-        """Get camera position prompt"""
-        if not position or not target:
-            return ""
-        
-        def safe_float(value, default=0.0):
-            if isinstance(value, (int, float)):
-                return float(value)
-            try:
-                return float(value)
-            except (ValueError, TypeError):
-                return default
-        
-        pos_x = safe_float(position.get("x", 0)) - safe_float(target.get("x", 0))
-        pos_y = safe_float(position.get("y", 0)) - safe_float(target.get("y", 0))
-        pos_z = safe_float(position.get("z", 0)) - safe_float(target.get("z", 0))
-        
-        horizontal_dist = math.sqrt(pos_x * pos_x + pos_z * pos_z)
+    def _get_camera_position_prompt(self, pos_x, pos_y, pos_z, pitch, yaw):
+        """Get camera position prompt from precomputed camera-to-target deltas"""
+        horizontal_dist = _hypot(pos_x, pos_z)
         
         if horizontal_dist < 0.001:
             return "above object" if pos_y > 0 else "below object"
         
-        angle_deg = math.degrees(math.atan2(pos_x, pos_z))
+        angle_deg = _RAD2DEG * _atan2(pos_x, pos_z)
         if angle_deg < 0:
             angle_deg += 360
         
-        parts = []
         angle_int = int(angle_deg)
         is_directly_front = (abs(angle_int) < 2 or abs(angle_int - 360) < 2) and pos_z > 0.1
-        
+
         if is_directly_front:
             return ""
-        
-        if pos_z < -0.1:
-            if abs(pos_x) < 0.1:
-                parts.append("looking from behind")
-            else:
-                if 90 <= angle_int <= 180:
-                    parts.append(f"Pan the camera {angle_int} degrees to the right-back side")
-                elif 180 < angle_int <= 270:
-                    parts.append(f"Pan the camera {angle_int} degrees to the left-back side")
-                else:
-                    parts.append(f"looking from behind at {angle_int} degree")
+
+        sign_z = -1 if pos_z < -0.1 else (1 if pos_z > 0.1 else 0)
+
+        if pos_x > 0.1:
+            sign_x = 1
+        elif pos_x < -0.1:
+            sign_x = -1
+        elif abs(pos_x) < 0.1:
+            sign_x = 0
+        elif sign_z == -1:
+            # |pos_x| exactly 0.1 still counts as off-center behind the object
+            sign_x = 1
         else:
-            if abs(pos_x) < 0.1:
-                if pos_z > 0.1:
-                    return ""
-                else:
-                    parts.append("looking from behind")
-            else:
-                if pos_x > 0.1:
-                    parts.append(f"Pan the camera {angle_int} degrees to the right")
-                elif pos_x < -0.1:
-                    if angle_int >= 270:
-                        left_angle = 360 - angle_int
-                        parts.append(f"Pan the camera {left_angle} degrees to the left")
-                    elif angle_int > 180:
-                        left_angle = angle_int
-                        parts.append(f"Pan the camera {left_angle} degrees to the left")
-                    else:
-                        parts.append(f"Pan the camera {angle_int} degrees to the left")
-        
-        return ", ".join(parts) if parts else ""
+            # ... but in front it matches neither pan direction
+            return ""
+
+        return _QUADRANT_PHRASE[(sign_x, sign_z)](angle_int)
+
+
+# FRAMING_THRESHOLDS sorted ascending by minimum percent so the matching
+# bucket (largest minimum not exceeding the value, i.e. the dict's original
+# first-match precedence) falls out of one bisect.
+_FRAMING = sorted(
+    ((min_pct, max_pct, name)
+     for name, (min_pct, max_pct) in AdvancedCameraControlNode.FRAMING_THRESHOLDS.items()),
+    key=lambda t: t[0],
+)
+_FRAMING_MINS = tuple(t[0] for t in _FRAMING)
+
+# CAMERA_SHOTS unzipped into parallel structure-of-arrays tuples. Distance
+# and FOV ranges already come sorted ascending, so the first table entry
+# containing a value is the first one whose max bound reaches it.
+_SHOT_NAMES = tuple(
+    sys.intern(AdvancedCameraControlNode._SHOT_NAME_TO_LOWER[s["name"]])
+    for s in AdvancedCameraControlNode.CAMERA_SHOTS
+)
+
+# Shot-type prompt string -> its snake_case JSON form, interned so repeated
+# prompts share one object and downstream dict keying compares by pointer.
+_SHOT_TYPE_TO_JSON = {
+    name: sys.intern(name.replace(" ", "_").replace("-", "_"))
+    for name in set(_SHOT_NAMES) | set(AdvancedCameraControlNode.FRAMING_THRESHOLDS)
+}
+_SHOT_DIST_MIN, _SHOT_DIST_MAX = zip(*(s["distance_m"] for s in AdvancedCameraControlNode.CAMERA_SHOTS))
+_SHOT_FOV_MIN, _SHOT_FOV_MAX = zip(*(s["fov_deg"] for s in AdvancedCameraControlNode.CAMERA_SHOTS))
+
+# The tilt entries of CAMERA_ANGLES, likewise unzipped; entries that have no
+# prompt form (Eye Level) carry None so the scan skips them.
+_ANGLE_TILT_MIN, _ANGLE_TILT_MAX, _ANGLE_TILT_NAMES = zip(*(
+    (a["tilt_deg"][0], a["tilt_deg"][1],
+     AdvancedCameraControlNode._ANGLE_NAME_TO_LOWER.get(a["name"]))
+    for a in AdvancedCameraControlNode.CAMERA_ANGLES if "tilt_deg" in a
+))
+
+# Tilt entries that can actually match (a prompt name and a non-inverted
+# range), sorted by their minimum so a bisect on the max bounds lands on the
+# same entry the original first-match scan returned.
+_TILT_BUCKETS = sorted(
+    (lo, hi, name)
+    for lo, hi, name in zip(_ANGLE_TILT_MIN, _ANGLE_TILT_MAX, _ANGLE_TILT_NAMES)
+    if name is not None and lo <= hi
+)
+_TILT_MAXS = tuple(t[1] for t in _TILT_BUCKETS)
+
+# Roll range of the "Dutch Low Angle" entry, resolved once so the angle
+# classifier does not have to scan CAMERA_ANGLES for it by name.
+_DUTCH_LOW_MIN, _DUTCH_LOW_MAX = next(
+    a["roll_deg"] for a in AdvancedCameraControlNode.CAMERA_ANGLES
+    if a["name"] == "Dutch Low Angle"
+)
+
+# Focal-length ranges run high-to-low; re-sort ascending and drop exact
+# duplicate ranges (which can never win a first-match scan) so bisect on the
+# min bounds reproduces the original iteration order.
+_focal_entries = []
+for _shot in AdvancedCameraControlNode.CAMERA_SHOTS:
+    _focal_range = tuple(_shot["focal_length_mm"])
+    if all(_focal_range != (e[0], e[1]) for e in _focal_entries):
+        _focal_entries.append(
+            _focal_range + (AdvancedCameraControlNode._SHOT_NAME_TO_LOWER[_shot["name"]],)
+        )
+_focal_entries.sort(key=lambda e: e[0])
+_SHOT_FOCAL_MIN = tuple(e[0] for e in _focal_entries)
+_SHOT_FOCAL_MAX = tuple(e[1] for e in _focal_entries)
+_SHOT_FOCAL_NAMES = tuple(e[2] for e in _focal_entries)
+del _focal_entries, _shot, _focal_range
+
+# The node is stateless, so one shared instance can serve the prompt cache.
+_CACHED_NODE = AdvancedCameraControlNode()
+
+
+def _coords_key(coords):
+    """Hashable cache key for an xyz dict, rounded to output precision"""
+    if not coords:
+        return None
+    return (
+        round(coords.get("x", 0), 3),
+        round(coords.get("y", 0), 3),
+        round(coords.get("z", 0), 3),
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _generate_prompt_cached(pos_key, tgt_key, zoom, focal_length_mm,
+                            object_scale_meters, custom_description):
+    """Run the full prompt pipeline for a hashable camera-state key"""
+    position = {"x": pos_key[0], "y": pos_key[1], "z": pos_key[2]} if pos_key else {}
+    target = {"x": tgt_key[0], "y": tgt_key[1], "z": tgt_key[2]} if tgt_key else {}
+
+    distance, pitch, yaw, roll = _CACHED_NODE._camera_geometry(position, target)
+    return _CACHED_NODE._format_prompt(
+        position, target, zoom, distance, pitch, yaw, roll,
+        focal_length_mm, object_scale_meters, custom_description
+    )
 
 
 NODE_CLASS_MAPPINGS = {